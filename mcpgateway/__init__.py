@@ -16,7 +16,18 @@ __url__ = "https://ibm.github.io/mcp-context-forge/"
 __download_url__ = "https://github.com/IBM/mcp-context-forge"
 __packages__ = ["mcpgateway"]
 
-from mcpgateway import reverse_proxy, wrapper, translate
+# Standard
+import importlib
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # First-Party
+    from mcpgateway import reverse_proxy, translate, wrapper
+
+# Submodules exposed as package attributes. They are imported on first access
+# (PEP 562) so that light entry points such as ``mcpgateway --version`` do not
+# pull in the whole service layer at package import.
+_LAZY_SUBMODULES = frozenset({"reverse_proxy", "wrapper", "translate"})
 
 # Export main components for easier imports
 __all__ = [
@@ -27,3 +38,29 @@ __all__ = [
     "wrapper",
     "translate",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the exported submodules lazily on first attribute access.
+
+    Args:
+        name: Attribute name looked up on the package.
+
+    Returns:
+        The imported submodule.
+
+    Raises:
+        AttributeError: If *name* is not a lazily exported submodule.
+
+    Examples:
+        >>> import mcpgateway
+        >>> mcpgateway.wrapper.__name__
+        'mcpgateway.wrapper'
+        >>> mcpgateway.missing
+        Traceback (most recent call last):
+        ...
+        AttributeError: module 'mcpgateway' has no attribute 'missing'
+    """
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -43,20 +43,16 @@ from pathlib import Path
 import sys
 from typing import List, Optional
 
-# Third-Party
-from pydantic import ValidationError
-import uvicorn
-
 # First-Party
 from mcpgateway import __version__
-from mcpgateway.config import Settings
 
 # ---------------------------------------------------------------------------
 # Configuration defaults (overridable via environment variables)
 # ---------------------------------------------------------------------------
 DEFAULT_APP = "mcpgateway.main:app"  # dotted path to FastAPI instance
-DEFAULT_HOST = os.getenv("MCG_HOST", "127.0.0.1")
-DEFAULT_PORT = int(os.getenv("MCG_PORT", "4444"))
+DEFAULT_HOST = os.environ.get("MCG_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("MCG_PORT", "4444"))
+_DEFAULT_PORT_STR = str(DEFAULT_PORT)  # normalized once; passed to uvicorn as-is
 
 # ---------------------------------------------------------------------------
 # Helper utilities
@@ -105,6 +101,10 @@ def _insert_defaults(raw_args: List[str]) -> List[str]:
         >>> result = _insert_defaults(["myapp.main:app", "--reload"])
         >>> result[0]
         'myapp.main:app'
+        >>> _insert_defaults(["--uds", "/tmp/mcpgateway.sock"])
+        ['mcpgateway.main:app', '--uds', '/tmp/mcpgateway.sock']
+        >>> _insert_defaults(["--host", "0.0.0.0", "--port", "8000"])
+        ['mcpgateway.main:app', '--host', '0.0.0.0', '--port', '8000']
     """
 
     args = list(raw_args)  # shallow copy - we'll mutate this
@@ -114,11 +114,12 @@ def _insert_defaults(raw_args: List[str]) -> List[str]:
         args.insert(0, DEFAULT_APP)
 
     # 2️⃣  Supply host/port if neither supplied nor UNIX domain socket.
-    if "--uds" not in args:
-        if "--host" not in args and "--http" not in args:
-            args.extend(["--host", DEFAULT_HOST])
-        if "--port" not in args:
-            args.extend(["--port", str(DEFAULT_PORT)])
+    flags = {a for a in args if a.startswith("--")}
+    if "--uds" not in flags:
+        if "--host" not in flags and "--http" not in flags:
+            args += ["--host", DEFAULT_HOST]
+        if "--port" not in flags:
+            args += ["--port", _DEFAULT_PORT_STR]
 
     return args
 
@@ -141,6 +142,11 @@ def _handle_validate_config(path: str = ".env") -> None:
         >>> _handle_validate_config(".env.example")
         ✅ Configuration in .env.example is valid
     """
+    # Third-Party
+    from pydantic import ValidationError  # pylint: disable=import-outside-toplevel
+
+    # First-Party
+    from mcpgateway.config import Settings  # pylint: disable=import-outside-toplevel
 
     try:
         Settings(_env_file=path)
@@ -172,6 +178,9 @@ def _handle_config_schema(output: Optional[str] = None) -> None:
         >>> _handle_config_schema("schema.json")  # doctest: +SKIP
         ✅ Schema written to schema.json
     """
+    # First-Party
+    from mcpgateway.config import Settings  # pylint: disable=import-outside-toplevel
+
     schema = Settings.model_json_schema(mode="validation")
     data = json.dumps(schema, indent=2, sort_keys=True)
 
@@ -347,6 +356,10 @@ def main() -> None:  # noqa: D401 - imperative mood is fine here
     user_args = sys.argv[1:]
     uvicorn_argv = _insert_defaults(user_args)
 
+    # Deferred so --version and the config helpers never pay for Uvicorn's import.
+    # Third-Party
+    import uvicorn  # pylint: disable=import-outside-toplevel
+
     # Uvicorn's `main()` uses sys.argv - patch it in and run.
     sys.argv = ["mcpgateway", *uvicorn_argv]
     uvicorn.main()  # pylint: disable=no-value-for-parameter
@@ -17,98 +17,37 @@ It implements the export/import CLI functionality according to the specification
 # Standard
 import argparse
 import asyncio
-import base64
-from datetime import datetime
-import json
 import logging
-import os
-from pathlib import Path
 import sys
-from typing import Any, Dict, Optional
-
-# Third-Party
-import aiohttp
 
 # First-Party
 from mcpgateway import __version__
-from mcpgateway.config import settings
+from mcpgateway.services.cli_service import (
+    AuthenticationError,
+    CLIError,
+    close_session,
+    export_configuration,
+    get_auth_token,
+    import_configuration,
+    make_authenticated_request,
+)
+
+__all__ = [
+    "AuthenticationError",
+    "CLIError",
+    "create_parser",
+    "export_command_wrapper",
+    "export_configuration",
+    "get_auth_token",
+    "import_command_wrapper",
+    "import_configuration",
+    "main_with_subcommands",
+    "make_authenticated_request",
+]
 
 logger = logging.getLogger(__name__)
 
 
-class CLIError(Exception):
-    """Base class for CLI-related errors."""
-
-
-class AuthenticationError(CLIError):
-    """Raised when authentication fails."""
-
-
-async def get_auth_token() -> Optional[str]:
-    """Get authentication token from environment or config.
-
-    Returns:
-        Authentication token string or None if not configured
-    """
-    # Try environment variable first
-    token = os.getenv("MCPGATEWAY_BEARER_TOKEN")
-    if token:
-        return token
-
-    # Fallback to basic auth if configured
-    if settings.basic_auth_user and settings.basic_auth_password:
-        creds = base64.b64encode(f"{settings.basic_auth_user}:{settings.basic_auth_password}".encode()).decode()
-        return f"Basic {creds}"
-
-    return None
-
-
-async def make_authenticated_request(method: str, url: str, json_data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Make an authenticated HTTP request to the gateway API.
-
-    Args:
-        method: HTTP method (GET, POST, etc.)
-        url: URL path for the request
-        json_data: Optional JSON data for request body
-        params: Optional query parameters
-
-    Returns:
-        JSON response from the API
-
-    Raises:
-        AuthenticationError: If no authentication is configured
-        CLIError: If the API request fails
-    """
-    token = await get_auth_token()
-    if not token:
-        raise AuthenticationError("No authentication configured. Set MCPGATEWAY_BEARER_TOKEN environment variable or configure BASIC_AUTH_USER/BASIC_AUTH_PASSWORD.")
-
-    headers = {"Content-Type": "application/json"}
-    if token.startswith("Basic "):
-        headers["Authorization"] = token
-    else:
-        headers["Authorization"] = f"Bearer {token}"
-
-    gateway_url = f"http://{settings.host}:{settings.port}"
-    full_url = f"{gateway_url}{url}"
-
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.request(method=method, url=full_url, json=json_data, params=params, headers=headers) as response:
-                if response.status >= 400:
-                    error_text = await response.text()
-                    raise CLIError(f"API request failed ({response.status}): {error_text}")
-
-                return await response.json()
-
-        except aiohttp.ClientError as e:
-            raise CLIError(f"Failed to connect to gateway at {gateway_url}: {str(e)}")
-
-
-# First-Party
-from mcpgateway.services.cli_service import export_configuration, import_configuration, CLIError
-# ... (rest of the imports)
-
 async def export_command_wrapper(args: argparse.Namespace) -> None:
     """Wrapper for the export command to be called from argparse."""
     try:
@@ -124,6 +63,9 @@ async def export_command_wrapper(args: argparse.Namespace) -> None:
     except CLIError as e:
         print(f"❌ Export failed: {str(e)}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        await close_session()
+
 
 async def import_command_wrapper(args: argparse.Namespace) -> None:
     """Wrapper for the import command to be called from argparse."""
@@ -135,10 +77,14 @@ async def import_command_wrapper(args: argparse.Namespace) -> None:
             rekey_secret=args.rekey_secret,
             include=args.include,
             verbose=args.verbose,
+            stream=getattr(args, "stream", False),
+            concurrency=getattr(args, "concurrency", 4),
         )
     except CLIError as e:
         print(f"❌ Import failed: {str(e)}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        await close_session()
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -171,6 +117,8 @@ def create_parser() -> argparse.ArgumentParser:
     import_parser.add_argument("--dry-run", action="store_true", help="Validate but don't make changes")
     import_parser.add_argument("--rekey-secret", help="New encryption secret for cross-environment imports")
     import_parser.add_argument("--include", help="Selective import: entity_type:name1,name2;entity_type2:name3")
+    import_parser.add_argument("--stream", action="store_true", help="Parse the file incrementally and import it in batches (requires ijson)")
+    import_parser.add_argument("--concurrency", type=int, default=4, help="Maximum batch requests in flight with --stream (default: 4)")
     import_parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     import_parser.set_defaults(func=import_command_wrapper)
 
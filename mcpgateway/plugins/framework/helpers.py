@@ -7,12 +7,19 @@ Authors: Your Name
 This module provides helper functions to simplify plugin development.
 """
 
+# Standard
+from functools import lru_cache
 import logging
 from typing import Any, Optional
 
+# First-Party
 from mcpgateway.plugins.framework.models import PluginContext
 
+# Attributes that live on the shared GlobalContext rather than on the PluginContext
+_GLOBAL_CONTEXT_KEYS = frozenset({"request_id", "user", "tenant_id", "server_id"})
 
+
+@lru_cache(maxsize=512)
 def get_plugin_logger(plugin_name: str) -> logging.Logger:
     """
     Get a namespaced logger for a plugin.
@@ -21,6 +28,9 @@ def get_plugin_logger(plugin_name: str) -> logging.Logger:
     `mcp.plugin.<plugin_name>`. This makes it easy to identify and filter
     log messages from a specific plugin in the gateway's logs.
 
+    Results are memoized, so repeated calls skip the logging module lock.
+    Plugins should still keep the returned logger on `self` in `__init__`.
+
     Args:
         plugin_name: The name of the plugin (usually the slug).
 
@@ -66,8 +76,10 @@ def get_config_value(context: PluginContext, key: str, default: Optional[Any] =
             self.logger.warning("api_key not found in plugin config.")
         ```
     """
-    if context.plugin_config and context.plugin_config.config:
-        return context.plugin_config.config.get(key, default)
+    plugin_config = getattr(context, "plugin_config", None)
+    config = plugin_config.config if plugin_config else None
+    if config:
+        return config.get(key, default)
     return default
 
 
@@ -94,4 +106,8 @@ def get_global_context_value(context: PluginContext, key: str, default: Optional
         self.logger.info(f"Processing request: {request_id}")
         ```
     """
+    if key in _GLOBAL_CONTEXT_KEYS:
+        # Read the pydantic field storage directly instead of going through getattr
+        value = context.global_context.__dict__.get(key)
+        return default if value is None else value
     return getattr(context, key, default)
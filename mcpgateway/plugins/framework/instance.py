@@ -5,10 +5,36 @@ SPDX-License-Identifier: Apache-2.0
 Authors: Your Name
 
 This module provides a singleton instance of the PluginManager.
+
+The manager is no longer built at import time; ``plugin_manager`` is resolved
+on first access through :func:`mcpgateway.plugins.framework.get_plugin_manager`.
 """
 
+# Standard
+from typing import Any
+
 # First-Party
-from mcpgateway.config import settings
-from mcpgateway.plugins.framework.manager import PluginManager
+from mcpgateway.plugins.framework import get_plugin_manager
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``plugin_manager`` lazily (PEP 562).
+
+    Args:
+        name: Attribute name looked up on the module.
+
+    Returns:
+        The shared PluginManager, or None when plugins are disabled.
+
+    Raises:
+        AttributeError: If *name* is not ``plugin_manager``.
 
-plugin_manager: PluginManager | None = PluginManager(settings.plugin_config_file) if settings.plugins_enabled else None
+    Examples:
+        >>> from mcpgateway.plugins.framework import instance
+        >>> pm = instance.plugin_manager
+        >>> pm is instance.get_plugin_manager()
+        True
+    """
+    if name == "plugin_manager":
+        return get_plugin_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,16 +9,55 @@ This module loads configurations for plugins.
 """
 
 # Standard
+from functools import lru_cache
 import os
 
 # Third-Party
 import jinja2
 import yaml
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    # Third-Party
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    # Third-Party
+    from yaml import SafeLoader as _SafeLoader
+
 # First-Party
 from mcpgateway.plugins.framework.models import Config, PluginSettings
 
 
+@lru_cache(maxsize=4)
+def _load_config_file(path: str, mtime_ns: int, use_jinja: bool, env: tuple[tuple[str, str], ...]) -> Config:  # pylint: disable=unused-argument
+    """Read, render and validate a plugin configuration file.
+
+    Results are memoized on the file's modification time (and on the
+    environment when Jinja rendering is enabled), so reloading an unchanged
+    file skips the YAML parse and model validation.
+
+    Args:
+        path: the absolute configuration path.
+        mtime_ns: the file modification time, used only as a cache key.
+        use_jinja: use jinja to replace env variables if true.
+        env: the environment variables available to the jinja template.
+
+    Returns:
+        The plugin configuration object. Callers must not mutate it.
+    """
+    if use_jinja:
+        with open(path, "r", encoding="utf-8") as file:
+            template = file.read()
+        jinja_env = jinja2.Environment(loader=jinja2.BaseLoader(), autoescape=True)
+        source = jinja_env.from_string(template).render(env=dict(env))
+    else:
+        # Let the YAML reader detect the encoding from raw bytes
+        with open(path, "rb") as file:
+            source = file.read()
+    config_data = yaml.load(source, Loader=_SafeLoader) or {}  # nosec B506 - safe loader
+    return Config(**config_data)
+
+
 class ConfigLoader:
     """A configuration loader.
 
@@ -72,16 +111,12 @@ class ConfigLoader:
             ...     os.unlink(temp_path)
             60
         """
+        path = os.path.abspath(config)
         try:
-            with open(os.path.normpath(config), "r", encoding="utf-8") as file:
-                template = file.read()
-                if use_jinja:
-                    jinja_env = jinja2.Environment(loader=jinja2.BaseLoader(), autoescape=True)
-                    rendered_template = jinja_env.from_string(template).render(env=os.environ)
-                else:
-                    rendered_template = template
-                config_data = yaml.safe_load(rendered_template) or {}
-            return Config(**config_data)
+            mtime_ns = os.stat(path).st_mtime_ns
+            env = tuple(sorted(os.environ.items())) if use_jinja else ()
+            # Hand out a copy so callers can't mutate the cached instance
+            return _load_config_file(path, mtime_ns, use_jinja, env).model_copy(deep=True)
         except FileNotFoundError:
             # Graceful fallback for tests and minimal environments without plugin config
             return Config(plugins=[], plugin_dirs=[], plugin_settings=PluginSettings())
@@ -33,7 +33,6 @@ import subprocess  # nosec B404 # Safe: Used only for git commands with hardcode
 from typing import Optional
 
 # Third-Party
-from copier import run_copy
 import typer
 from typing_extensions import Annotated
 
@@ -143,6 +142,10 @@ def bootstrap(
         defaults: Bootstrap with defaults.
         dry_run: Run but do not make any changes.
     """
+    # Copier pulls in Jinja2, questionary and prompt_toolkit; only load it when bootstrapping.
+    # Third-Party
+    from copier import run_copy  # pylint: disable=import-outside-toplevel
+
     try:
         if command_exists("git"):
             run_copy(
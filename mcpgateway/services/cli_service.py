@@ -9,21 +9,70 @@ This module provides the business logic for the CLI commands.
 """
 
 # Standard
+import asyncio
 import base64
-from datetime import datetime
-import json
-import logging
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, List
+import re
+import time
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional
 
 # Third-Party
 import aiohttp
+import orjson
+
+try:
+    # Third-Party
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    # Streaming imports are unavailable without ijson
+    ijson = None  # type: ignore
+
+try:
+    # Third-Party
+    import aiodns  # noqa: F401  # pylint: disable=unused-import
+
+    # aiohttp's AsyncResolver needs aiodns; without it the threaded default resolver is used
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
 
 # First-Party
 from mcpgateway.config import settings
 
-logger = logging.getLogger(__name__)
+# Shared across calls so batched export/import requests reuse pooled connections
+_session: Optional[aiohttp.ClientSession] = None
+# No overall cap so large streamed exports and import batches can run as long as
+# data keeps flowing; fail fast on connect and when the gateway stops responding
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=300)
+# Server-side processing order; streamed batches follow it so dependencies are created first
+_IMPORT_ORDER = ("roots", "gateways", "tools", "resources", "prompts", "servers")
+_IMPORT_BATCH_SIZE = 500
+_IMPORT_CONCURRENCY = 4
+# Exports at least this large (or of unknown size) are written to disk as they arrive
+_STREAM_EXPORT_THRESHOLD = 1024 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+# (label, key, default) for each import progress counter, in report order
+_PROGRESS_FIELDS = (
+    ("Total entities", "total", 0),
+    ("Processed", "processed", 0),
+    ("Created", "created", 0),
+    ("Updated", "updated", 0),
+    ("Skipped", "skipped", 0),
+    ("Failed", "failed", 0),
+)
+# One "entity_type:name1,name2" group of an --include selection; groups are separated by ";"
+_INCLUDE_RE = re.compile(r"\s*([^:;,\s]+)\s*:([^;]*)")
+# The bearer token rarely changes during a CLI run; read it once at import
+_ENV_TOKEN: Optional[str] = os.getenv("MCPGATEWAY_BEARER_TOKEN")
+# (bearer env var, basic user, basic password) -> resolved token
+_auth_cache: Optional[tuple[tuple[Optional[str], Optional[str], Optional[str]], Optional[str]]] = None
 
 
 class CLIError(Exception):
@@ -35,42 +84,183 @@ class AuthenticationError(CLIError):
 
 
 async def get_auth_token() -> Optional[str]:
-    """Get authentication token from environment or config."""
-    token = os.getenv("MCPGATEWAY_BEARER_TOKEN")
-    if token:
-        return token
+    """Get authentication token from environment or config.
 
-    if settings.basic_auth_user and settings.basic_auth_password:
-        creds = base64.b64encode(f"{settings.basic_auth_user}:{settings.basic_auth_password}".encode()).decode()
-        return f"Basic {creds}"
+    The result is cached until the bearer token or basic auth credentials change.
+    """
+    global _auth_cache  # pylint: disable=global-statement
+    # The snapshot covers the usual case; fall back to the live env so a token set later is still honoured
+    env_token = _ENV_TOKEN or os.getenv("MCPGATEWAY_BEARER_TOKEN")
+    key = (env_token, settings.basic_auth_user, settings.basic_auth_password)
+    if _auth_cache is not None and _auth_cache[0] == key:
+        return _auth_cache[1]
 
-    return None
+    token = env_token or None
+    if not token and settings.basic_auth_user and settings.basic_auth_password:
+        token = (b"Basic " + base64.b64encode(f"{settings.basic_auth_user}:{settings.basic_auth_password}".encode())).decode("ascii")
 
+    _auth_cache = (key, token)
+    return token
 
-async def make_authenticated_request(method: str, url: str, json_data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Make an authenticated HTTP request to the gateway API."""
+
+def refresh_env_token() -> None:
+    """Re-read ``MCPGATEWAY_BEARER_TOKEN`` after the environment has changed."""
+    global _ENV_TOKEN  # pylint: disable=global-statement
+    _ENV_TOKEN = os.getenv("MCPGATEWAY_BEARER_TOKEN")
+
+
+def _invalidate_auth_cache() -> None:
+    """Forget the cached auth token so the next lookup recomputes it."""
+    global _auth_cache  # pylint: disable=global-statement
+    _auth_cache = None
+
+
+@lru_cache(maxsize=4)
+def _auth_headers(token: str) -> Mapping[str, str]:
+    """Build the request headers for an auth token once and reuse them.
+
+    Args:
+        token: Bearer token, or a ready-made ``Basic ...`` credential.
+
+    Returns:
+        Read-only mapping with the content type and Authorization header.
+    """
+    authorization = token if token.startswith("Basic ") else f"Bearer {token}"
+    return MappingProxyType({"Content-Type": "application/json", "Authorization": authorization})
+
+
+@lru_cache(maxsize=1)
+def _gateway_base() -> str:
+    """Return the gateway root URL, built once from settings.
+
+    Call ``_gateway_base.cache_clear()`` after changing ``settings.host`` or ``settings.port``.
+
+    Returns:
+        The gateway URL without a trailing slash.
+    """
+    return f"http://{settings.host}:{settings.port}"
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use.
+
+    Must be called from within a running event loop.
+
+    Returns:
+        The module-level aiohttp session.
+    """
+    global _session  # pylint: disable=global-statement
+    if _session is None or _session.closed:
+        resolver = aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+        connector = aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300, resolver=resolver)
+        _session = aiohttp.ClientSession(connector=connector, timeout=_REQUEST_TIMEOUT)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session, if one was opened."""
+    global _session  # pylint: disable=global-statement
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+@asynccontextmanager
+async def _authenticated_response(method: str, url: str, json_data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[aiohttp.ClientResponse]:
+    """Send an authenticated request to the gateway API and yield the successful response.
+
+    Args:
+        method: HTTP method.
+        url: API path, relative to the gateway root.
+        json_data: Optional JSON request body.
+        params: Optional query parameters.
+
+    Yields:
+        The open response; its body is available until the context exits.
+
+    Raises:
+        AuthenticationError: If no credentials are configured.
+        CLIError: If the gateway is unreachable or answers with an error status.
+    """
     token = await get_auth_token()
     if not token:
         raise AuthenticationError("No authentication configured. Set MCPGATEWAY_BEARER_TOKEN or BASIC_AUTH_USER/PASSWORD.")
 
-    headers = {"Content-Type": "application/json"}
-    if token.startswith("Basic "):
-        headers["Authorization"] = token
-    else:
-        headers["Authorization"] = f"Bearer {token}"
+    headers = _auth_headers(token)
 
-    gateway_url = f"http://{settings.host}:{settings.port}"
+    gateway_url = _gateway_base()
     full_url = f"{gateway_url}{url}"
 
-    async with aiohttp.ClientSession() as session:
+    session = _get_session()
+    # Serialize with orjson ourselves rather than letting aiohttp run stdlib json.dumps
+    body = orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS) if json_data is not None else None
+    try:
+        async with session.request(method=method, url=full_url, data=body, params=params, headers=headers) as response:
+            if response.status >= 400:
+                error_text = await response.text()
+                raise CLIError(f"API request failed ({response.status}): {error_text}")
+            yield response
+    except aiohttp.ClientError as e:
+        raise CLIError(f"Failed to connect to gateway at {gateway_url}: {str(e)}")
+    except asyncio.TimeoutError:
+        raise CLIError(f"Request to gateway at {gateway_url} timed out")
+
+
+async def make_authenticated_request(method: str, url: str, json_data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Make an authenticated HTTP request to the gateway API."""
+    async with _authenticated_response(method, url, json_data=json_data, params=params) as response:
+        return await response.json(loads=orjson.loads)
+
+
+async def _download_export(params: Dict[str, Any], output_path: Path) -> Optional[Dict[str, Any]]:
+    """Fetch an export, streaming large bodies straight to disk.
+
+    Responses known to be smaller than ``_STREAM_EXPORT_THRESHOLD`` are decoded
+    and returned so they can be pretty-printed. Anything larger, or of unknown
+    size, is written chunk by chunk to a temporary file next to ``output_path``
+    and moved into place only once the whole body has arrived, so a failed
+    download never leaves a truncated file or clobbers an existing export.
+
+    Args:
+        params: Export query parameters.
+        output_path: File that receives a streamed body.
+
+    Returns:
+        The decoded export, or None if the body was streamed to ``output_path``.
+    """
+    async with _authenticated_response("GET", "/export", params=params) as response:
+        if response.content_length is not None and response.content_length < _STREAM_EXPORT_THRESHOLD:
+            return await response.json(loads=orjson.loads)
+        part_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.part")
         try:
-            async with session.request(method=method, url=full_url, json=json_data, params=params, headers=headers) as response:
-                if response.status >= 400:
-                    error_text = await response.text()
-                    raise CLIError(f"API request failed ({response.status}): {error_text}")
-                return await response.json()
-        except aiohttp.ClientError as e:
-            raise CLIError(f"Failed to connect to gateway at {gateway_url}: {str(e)}")
+            with open(part_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(part_path, output_path)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+    return None
+
+
+def _read_export_summary(output_path: Path) -> Dict[str, Any]:
+    """Read the fields reported after an export from the written file.
+
+    Only the header and ``metadata.entity_counts`` are parsed when ijson is
+    available; otherwise the whole file is decoded.
+
+    Args:
+        output_path: Export file to summarize.
+
+    Returns:
+        Export fields shaped like the export document.
+    """
+    if not IJSON_AVAILABLE:
+        return orjson.loads(output_path.read_bytes())
+
+    summary = _read_export_header(output_path)
+    summary["metadata"] = {"entity_counts": _read_entity_counts(output_path) or {}}
+    return summary
 
 
 async def export_configuration(
@@ -83,31 +273,30 @@ async def export_configuration(
     verbose: bool = False,
 ) -> None:
     """Export gateway configuration."""
-    print(f"Exporting configuration from gateway at http://{settings.host}:{settings.port}")
-
-    params = {}
-    if types:
-        params["types"] = types
-    if exclude_types:
-        params["exclude_types"] = exclude_types
-    if tags:
-        params["tags"] = tags
-    if include_inactive:
-        params["include_inactive"] = "true"
-    if not include_dependencies:
-        params["include_dependencies"] = "false"
-
-    export_data = await make_authenticated_request("GET", "/export", params=params)
+    print(f"Exporting configuration from gateway at {_gateway_base()}")
+
+    options = (
+        ("types", types, types),
+        ("exclude_types", exclude_types, exclude_types),
+        ("tags", tags, tags),
+        ("include_inactive", "true", include_inactive),
+        ("include_dependencies", "false", not include_dependencies),
+    )
+    params = {key: value for key, value, enabled in options if enabled}
 
     if output_file:
         output_path = Path(output_file)
     else:
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        timestamp = time.strftime("%Y%m%d-%H%M%S")
         output_path = Path(f"mcpgateway-export-{timestamp}.json")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(export_data, f, indent=2, ensure_ascii=False)
+    export_data = await _download_export(params, output_path)
+    if export_data is None:
+        # Large export already streamed to disk as received
+        export_data = _read_export_summary(output_path)
+    else:
+        output_path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
     metadata = export_data.get("metadata", {})
     entity_counts = metadata.get("entity_counts", {})
@@ -116,9 +305,9 @@ async def export_configuration(
     print("✅ Export completed successfully!")
     print(f"📁 Output file: {output_path}")
     print(f"📊 Exported {total_entities} total entities:")
-    for entity_type, count in entity_counts.items():
-        if count > 0:
-            print(f"   • {entity_type}: {count}")
+    present = {entity_type: count for entity_type, count in entity_counts.items() if count}
+    if present:
+        print("\n".join(f"   • {entity_type}: {count}" for entity_type, count in present.items()))
 
     if verbose:
         print("\n🔍 Export details:")
@@ -128,6 +317,162 @@ async def export_configuration(
         print(f"   • Source: {export_data.get('source_gateway')}")
 
 
+def _read_export_header(input_path: Path) -> Dict[str, Any]:
+    """Collect the top-level scalar fields of an export file without loading its entities.
+
+    Args:
+        input_path: Export file to scan.
+
+    Returns:
+        Top-level fields such as ``version`` and ``exported_at``.
+    """
+    header: Dict[str, Any] = {}
+    with open(input_path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if event == "map_key" and not prefix and value == "entities" and "version" in header and "exported_at" in header:
+                break
+            if prefix and "." not in prefix and event in ("string", "number", "boolean", "null"):
+                header[prefix] = value
+    return header
+
+
+def _read_entity_counts(input_path: Path) -> Optional[Dict[str, int]]:
+    """Read ``metadata.entity_counts`` from an export file without loading its entities.
+
+    Args:
+        input_path: Export file to scan.
+
+    Returns:
+        Entity counts per type, or None if the file has no counts.
+    """
+    with open(input_path, "rb") as f:
+        return next(ijson.items(f, "metadata.entity_counts"), None)
+
+
+def _iter_entity_batches(input_path: Path, entity_type: str, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the entities of one type from an export file in fixed-size batches.
+
+    Args:
+        input_path: Export file to read.
+        entity_type: Key under ``entities`` to stream.
+        batch_size: Maximum number of entities per batch.
+
+    Yields:
+        Lists of at most ``batch_size`` entities.
+    """
+    with open(input_path, "rb") as f:
+        batch: List[Dict[str, Any]] = []
+        for item in ijson.items(f, f"entities.{entity_type}.item", use_float=True):
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _merge_import_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the responses of several batched imports into one result.
+
+    Args:
+        results: Import responses in the order they were received.
+
+    Returns:
+        A result shaped like a single import response with summed progress counters.
+    """
+    progress = {key: default for _, key, default in _PROGRESS_FIELDS}
+    warnings: List[Any] = []
+    errors: List[Any] = []
+    status = "completed"
+    for result in results:
+        for field, value in result.get("progress", {}).items():
+            if field in progress:
+                progress[field] += value
+        warnings.extend(result.get("warnings", []))
+        errors.extend(result.get("errors", []))
+        if result.get("status", "unknown") != "completed":
+            status = result.get("status", "unknown")
+
+    return {
+        "import_id": ", ".join(str(r["import_id"]) for r in results if r.get("import_id")),
+        "status": status,
+        "progress": progress,
+        "warnings": warnings,
+        "errors": errors,
+        "started_at": results[0].get("started_at"),
+        "completed_at": results[-1].get("completed_at"),
+    }
+
+
+async def _stream_import(input_path: Path, request_data: Dict[str, Any], batch_size: int, concurrency: int) -> Dict[str, Any]:
+    """Import an export file in batches so memory use is bounded by the batch size.
+
+    Batches of the same entity type are posted concurrently, at most
+    ``concurrency`` at a time; entity types are still imported one after
+    another so dependencies exist before their dependents.
+
+    Args:
+        input_path: Export file to import.
+        request_data: Import options shared by every batch (conflict strategy, dry run, ...).
+        batch_size: Maximum number of entities sent per request.
+        concurrency: Maximum number of batch requests in flight.
+
+    Returns:
+        The merged result of all batch requests.
+    """
+    header = _read_export_header(input_path)
+    counts = _read_entity_counts(input_path)
+    # Each entity type costs a full pass over the file, so skip types the export says are empty
+    entity_types = _IMPORT_ORDER if counts is None else [t for t in _IMPORT_ORDER if counts.get(t)]
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = asyncio.Event()
+
+    async def post(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one batch, flagging a failure and freeing its slot when done.
+
+        Args:
+            payload: Import request body for the batch.
+
+        Returns:
+            The gateway's import response for the batch.
+        """
+        try:
+            return await make_authenticated_request("POST", "/import", json_data=payload)
+        except BaseException:
+            failed.set()
+            raise
+        finally:
+            semaphore.release()
+
+    results = []
+    for entity_type in entity_types:
+        batches = _iter_entity_batches(input_path, entity_type, batch_size)
+        tasks: List[asyncio.Task] = []
+        try:
+            while True:
+                # Wait for a free slot before parsing the next batch so only `concurrency` are held in memory
+                await semaphore.acquire()
+                batch = None if failed.is_set() else next(batches, None)
+                if batch is None:
+                    # Done, or a batch failed: stop sending and let gather raise its error
+                    semaphore.release()
+                    break
+                payload = {**request_data, "import_data": {**header, "entities": {entity_type: batch}}}
+                tasks.append(asyncio.create_task(post(payload)))
+            results.extend(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+            batches.close()
+
+    if not results:
+        # Nothing to import; still let the gateway validate the file header
+        payload = {**request_data, "import_data": {**header, "entities": {}}}
+        results.append(await make_authenticated_request("POST", "/import", json_data=payload))
+
+    return _merge_import_results(results)
+
+
 async def import_configuration(
     input_file: str,
     conflict_strategy: str = "update",
@@ -135,19 +480,25 @@ async def import_configuration(
     rekey_secret: Optional[str] = None,
     include: Optional[str] = None,
     verbose: bool = False,
+    stream: bool = False,
+    batch_size: int = _IMPORT_BATCH_SIZE,
+    concurrency: int = _IMPORT_CONCURRENCY,
 ) -> None:
-    """Import gateway configuration."""
+    """Import gateway configuration.
+
+    With ``stream`` set, the file is parsed incrementally with ijson and its
+    entities are posted in batches of ``batch_size`` instead of all at once,
+    with up to ``concurrency`` batches in flight.
+    """
     input_path = Path(input_file)
     if not input_path.exists():
         raise CLIError(f"Input file not found: {input_path}")
+    if stream and not IJSON_AVAILABLE:
+        raise CLIError("Streaming import requires ijson. Install it with: pip install mcp-contextforge-gateway[streaming]")
 
     print(f"Importing configuration from {input_path}")
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        import_data = json.load(f)
-
-    request_data = {
-        "import_data": import_data,
+    request_data: Dict[str, Any] = {
         "conflict_strategy": conflict_strategy,
         "dry_run": dry_run,
     }
@@ -156,15 +507,13 @@ async def import_configuration(
         request_data["rekey_secret"] = rekey_secret
 
     if include:
-        selected_entities = {}
-        for selection in include.split(";"):
-            if ":" in selection:
-                entity_type, entity_list = selection.split(":", 1)
-                entities = [e.strip() for e in entity_list.split(",") if e.strip()]
-                selected_entities[entity_type] = entities
-        request_data["selected_entities"] = selected_entities
+        request_data["selected_entities"] = {m.group(1): [e for e in (x.strip() for x in m.group(2).split(",")) if e] for m in _INCLUDE_RE.finditer(include)}
 
-    result = await make_authenticated_request("POST", "/import", json_data=request_data)
+    if stream:
+        result = await _stream_import(input_path, request_data, batch_size, max(1, concurrency))
+    else:
+        request_data["import_data"] = orjson.loads(input_path.read_bytes())
+        result = await make_authenticated_request("POST", "/import", json_data=request_data)
 
     status = result.get("status", "unknown")
     progress = result.get("progress", {})
@@ -175,12 +524,8 @@ async def import_configuration(
         print(f"✅ Import {status}!")
 
     print("📊 Results:")
-    print(f"   • Total entities: {progress.get('total', 0)}")
-    print(f"   • Processed: {progress.get('processed', 0)}")
-    print(f"   • Created: {progress.get('created', 0)}")
-    print(f"   • Updated: {progress.get('updated', 0)}")
-    print(f"   • Skipped: {progress.get('skipped', 0)}")
-    print(f"   • Failed: {progress.get('failed', 0)}")
+    for label, key, default in _PROGRESS_FIELDS:
+        print(f"   • {label}: {progress.get(key, default)}")
 
     warnings = result.get("warnings", [])
     if warnings:
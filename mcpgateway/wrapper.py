@@ -51,6 +51,7 @@ import errno
 import json
 import logging
 import os
+import re
 import signal
 import sys
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
@@ -58,6 +59,7 @@ from urllib.parse import urlencode
 
 # Third-Party
 import httpx
+import orjson
 
 # First-Party
 from mcpgateway.utils.retry_manager import ResilientHttpClient
@@ -73,6 +75,10 @@ JSONRPC_PARSE_ERROR = -32700
 JSONRPC_INTERNAL_ERROR = -32603
 JSONRPC_SERVER_ERROR = -32000
 
+# orjson only handles 64-bit integers and decodes anything wider as a float;
+# a run this long may not fit, so such payloads go through the stdlib instead.
+_WIDE_INT_RE = re.compile(r"\d{19,}")
+
 CONTENT_TYPE = os.getenv("FORGE_CONTENT_TYPE", "application/json")
 
 # Global logger
@@ -182,6 +188,62 @@ def convert_url(url: str) -> str:
     return url + "/mcp/"
 
 
+def dumps_json(obj: Any) -> bytes:
+    """Serialize an object to JSON without altering its values.
+
+    orjson is used where it can represent the payload; integers wider than
+    64 bits and strings with lone surrogates fall back to the stdlib encoder.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+
+    Examples:
+        >>> dumps_json({"id": 1})
+        b'{"id":1}'
+        >>> dumps_json({"id": 2**70})
+        b'{"id": 1180591620717411303424}'
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Lone surrogates can only occur inside strings, where backslashreplace yields the JSON escape.
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8", errors="backslashreplace")
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON without altering its values.
+
+    orjson is used unless the payload may hold an integer wider than 64 bits,
+    or orjson rejects it (e.g. lone surrogate escapes); the stdlib parser then
+    decodes it exactly.
+
+    Args:
+        data: JSON text.
+
+    Returns:
+        Any: Decoded object.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+
+    Examples:
+        >>> loads_json('{"id": 1}')
+        {'id': 1}
+        >>> loads_json(b'{"id": 1180591620717411303424}')
+        {'id': 1180591620717411303424}
+    """
+    text = data.decode("utf-8") if isinstance(data, bytes) else data
+    if _WIDE_INT_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def send_to_stdout(obj: Union[dict, str]) -> None:
     """Write JSON-serializable object to stdout.
 
@@ -192,7 +254,7 @@ def send_to_stdout(obj: Union[dict, str]) -> None:
         If writing fails (e.g., broken pipe), triggers shutdown.
     """
     try:
-        line = json.dumps(obj, ensure_ascii=False)
+        line = dumps_json(obj).decode("utf-8")
     except Exception:
         line = str(obj)
     try:
@@ -257,7 +319,7 @@ async def stdin_reader(queue: "asyncio.Queue[Union[dict, list, str, None]]") ->
         if not line:
             continue
         try:
-            obj = json.loads(line)
+            obj = loads_json(line)
         except Exception:
             obj = make_error("Invalid JSON from stdin", JSONRPC_PARSE_ERROR, line)
         await queue.put(obj)
@@ -287,16 +349,15 @@ async def ndjson_lines(resp: httpx.Response) -> AsyncIterator[str]:
             break
         if not chunk:
             continue
-        text = decoder.decode(chunk)
-        buffer += text
-        while True:
-            nl_idx = buffer.find("\n")
-            if nl_idx == -1:
-                break
-            line = buffer[:nl_idx]
-            buffer = buffer[nl_idx + 1 :]  # noqa: E203
-            if line.strip():
-                yield line.strip()
+        buffer += decoder.decode(chunk)
+        if "\n" not in buffer:
+            continue
+        # Split every complete line in one pass; keep the trailing partial line buffered
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
     tail = decoder.decode(b"", final=True)
     buffer += tail
     if buffer.strip():
@@ -320,15 +381,12 @@ async def sse_events(resp: httpx.Response) -> AsyncIterator[str]:
             break
         if not chunk:
             continue
-        text = decoder.decode(chunk)
-        buffer += text
-        while True:
-            nl_idx = buffer.find("\n")
-            if nl_idx == -1:
-                break
-            raw_line = buffer[:nl_idx]
-            buffer = buffer[nl_idx + 1 :]  # noqa: E203
-
+        buffer += decoder.decode(chunk)
+        if "\n" not in buffer:
+            continue
+        # Split every complete line in one pass; keep the trailing partial line buffered
+        *raw_lines, buffer = buffer.split("\n")
+        for raw_line in raw_lines:
             line = raw_line.rstrip("\r")
             if line == "":
                 if event_lines:
@@ -410,7 +468,7 @@ async def forward_once(
 
     elif content_type == "application/json":
         # Force JSON
-        body = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+        body = payload if isinstance(payload, str) else dumps_json(payload)
         headers["Content-Type"] = "application/json; charset=utf-8"
 
     else:
@@ -419,10 +477,10 @@ async def forward_once(
             body = urlencode(payload)
             headers["Content-Type"] = "application/x-www-form-urlencoded"
         else:
-            body = payload if isinstance(payload, str) else json.dumps(payload, ensure_ascii=False)
+            body = payload if isinstance(payload, str) else dumps_json(payload)
             headers["Content-Type"] = "application/json; charset=utf-8"
 
-    body_bytes = body.encode("utf-8")
+    body_bytes = body if isinstance(body, bytes) else body.encode("utf-8")
 
     # Step 2: Send request and process response
     async with client.stream("POST", settings.server_url, data=body_bytes, headers=headers) as resp:
@@ -454,7 +512,7 @@ async def forward_once(
             if shutting_down():
                 return
             try:
-                obj = json.loads(line)
+                obj = loads_json(line)
                 send_to_stdout(obj)
             except Exception:
                 logger.warning("Invalid JSON from server: %s", line)
@@ -480,11 +538,10 @@ async def forward_once(
         if "application/json" in ctype:
             raw = await resp.aread()
             if not shutting_down():
-                text = raw.decode("utf-8", errors="replace")
                 try:
-                    send_to_stdout(json.loads(text))
+                    send_to_stdout(loads_json(raw))
                 except Exception:
-                    send_to_stdout(make_error("Invalid JSON response", JSONRPC_PARSE_ERROR, text))
+                    send_to_stdout(make_error("Invalid JSON response", JSONRPC_PARSE_ERROR, raw.decode("utf-8", errors="replace")))
             return
 
         # Fallback: try parsing as NDJSON
@@ -8,6 +8,7 @@ Unit tests for config and plugin loaders.
 """
 
 # Standard
+import os
 from unittest.mock import MagicMock, patch
 
 # Third-Party
@@ -39,6 +40,32 @@ def test_config_loader_load():
     assert srconfig.words[0].replace == "crud"
 
 
+def test_config_loader_cache_invalidated_on_change(tmp_path):
+    """Reloading an unchanged file reuses the parse; modifying it picks up the change."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("plugin_settings: {}\nplugin_dirs: ['/a']\n", encoding="utf-8")
+
+    first = ConfigLoader.load_config(str(config_path), use_jinja=False)
+    first.plugin_dirs.append("/mutated")
+    second = ConfigLoader.load_config(str(config_path), use_jinja=False)
+    assert second.plugin_dirs == ["/a"]
+
+    config_path.write_text("plugin_settings: {}\nplugin_dirs: ['/b', '/c']\n", encoding="utf-8")
+    os.utime(config_path, ns=(0, config_path.stat().st_mtime_ns + 1_000_000_000))
+    third = ConfigLoader.load_config(str(config_path), use_jinja=False)
+    assert third.plugin_dirs == ["/b", "/c"]
+
+
+def test_config_loader_reads_bytes(tmp_path):
+    """Configs loaded without jinja are handed to YAML as bytes, so its encoding detection applies."""
+    config_path = tmp_path / "config.yaml"
+    # UTF-16 with a BOM can't be read through a UTF-8 text decoder
+    config_path.write_bytes("plugin_settings: {}\nplugin_dirs: ['/café']\n".encode("utf-16"))
+
+    config = ConfigLoader.load_config(str(config_path), use_jinja=False)
+    assert config.plugin_dirs == ["/café"]
+
+
 @pytest.mark.asyncio
 async def test_plugin_loader_load():
     """Load a plugin with the plugin loader."""
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/plugins/framework/test_helpers.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Tests for the plugin development helpers.
+"""
+
+# Standard
+import logging
+from types import SimpleNamespace
+
+# First-Party
+from mcpgateway.plugins.framework import GlobalContext, PluginContext
+from mcpgateway.plugins.framework.helpers import get_config_value, get_global_context_value, get_plugin_logger
+
+
+def test_get_plugin_logger():
+    logger = get_plugin_logger("my_plugin")
+
+    assert logger.name == "mcp.plugin.my_plugin"
+    assert logger is logging.getLogger("mcp.plugin.my_plugin")
+    assert get_plugin_logger("my_plugin") is logger
+
+
+def test_get_global_context_value_known_keys():
+    context = PluginContext(global_context=GlobalContext(request_id="req-1", user="alice", server_id="srv-1"))
+
+    assert get_global_context_value(context, "request_id") == "req-1"
+    assert get_global_context_value(context, "user") == "alice"
+    assert get_global_context_value(context, "server_id") == "srv-1"
+    assert get_global_context_value(context, "tenant_id", "default-tenant") == "default-tenant"
+
+
+def test_get_global_context_value_unknown_key_falls_back_to_context():
+    context = PluginContext(global_context=GlobalContext(request_id="req-1"))
+
+    assert get_global_context_value(context, "state") == {}
+    assert get_global_context_value(context, "missing", "fallback") == "fallback"
+
+
+def test_get_config_value():
+    context = PluginContext(global_context=GlobalContext(request_id="req-1"))
+    assert get_config_value(context, "api_key", "default_key") == "default_key"
+
+    context_with_config = SimpleNamespace(plugin_config=SimpleNamespace(config={"api_key": "secret"}))
+    assert get_config_value(context_with_config, "api_key", "default_key") == "secret"
+    assert get_config_value(context_with_config, "other", "default_key") == "default_key"
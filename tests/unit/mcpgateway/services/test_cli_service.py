@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+"""Location: ./tests/unit/mcpgateway/services/test_cli_service.py
+Copyright 2025
+SPDX-License-Identifier: Apache-2.0
+
+Unit tests for the CLI service.
+Tests HTTP session handling and the export/import commands.
+"""
+
+# Standard
+import asyncio
+from contextlib import asynccontextmanager
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Third-Party
+import pytest
+
+# First-Party
+from mcpgateway.services import cli_service
+
+
+@pytest.fixture(autouse=True)
+async def reset_session(monkeypatch):
+    """Make sure every test starts and ends without a shared session."""
+    monkeypatch.setattr(cli_service, "_ENV_TOKEN", None)
+    await cli_service.close_session()
+    cli_service._invalidate_auth_cache()
+    cli_service._gateway_base.cache_clear()
+    yield
+    await cli_service.close_session()
+    cli_service._invalidate_auth_cache()
+    cli_service._gateway_base.cache_clear()
+
+
+class TestSession:
+    """Test the shared aiohttp session."""
+
+    async def test_session_is_reused(self):
+        """Consecutive calls return the same open session."""
+        first = cli_service._get_session()
+        second = cli_service._get_session()
+        assert first is second
+        assert not first.closed
+
+    async def test_session_uses_shared_timeout(self):
+        """The session applies the module-wide request timeout."""
+        session = cli_service._get_session()
+        assert session.timeout is cli_service._REQUEST_TIMEOUT
+        assert session.timeout.total is None
+        assert session.timeout.sock_connect == 10
+        assert session.timeout.sock_read == 300
+
+    async def test_session_connector_settings(self):
+        """Connections are pooled and resolved gateway addresses cached."""
+        with patch.object(cli_service.aiohttp, "TCPConnector", wraps=cli_service.aiohttp.TCPConnector) as mock_connector:
+            cli_service._get_session()
+        kwargs = mock_connector.call_args.kwargs
+        assert kwargs["ttl_dns_cache"] == 300
+        assert kwargs["keepalive_timeout"] == 60
+
+    async def test_resolver_depends_on_aiodns(self):
+        """The async resolver is only used when aiodns is installed."""
+        with patch.object(cli_service, "AIODNS_AVAILABLE", False), patch.object(cli_service.aiohttp, "AsyncResolver") as mock_resolver:
+            cli_service._get_session()
+        mock_resolver.assert_not_called()
+        await cli_service.close_session()
+
+        with patch.object(cli_service, "AIODNS_AVAILABLE", True), patch.object(cli_service.aiohttp, "AsyncResolver") as mock_resolver:
+            with patch.object(cli_service.aiohttp, "TCPConnector") as mock_connector, patch.object(cli_service.aiohttp, "ClientSession"):
+                cli_service._get_session()
+        assert mock_connector.call_args.kwargs["resolver"] is mock_resolver.return_value
+        cli_service._session = None
+
+    async def test_close_session(self):
+        """Closing releases the session and a new one is created afterwards."""
+        first = cli_service._get_session()
+        await cli_service.close_session()
+        assert first.closed
+        assert cli_service._session is None
+
+        second = cli_service._get_session()
+        assert second is not first
+        assert not second.closed
+
+    async def test_close_session_without_session(self):
+        """Closing when no session exists is a no-op."""
+        await cli_service.close_session()
+        assert cli_service._session is None
+
+
+def test_gateway_base(monkeypatch):
+    """The base URL is built from settings and cached until cleared."""
+    monkeypatch.setattr(cli_service.settings, "host", "gateway.local")
+    monkeypatch.setattr(cli_service.settings, "port", 4444)
+    assert cli_service._gateway_base() == "http://gateway.local:4444"
+
+    monkeypatch.setattr(cli_service.settings, "port", 5555)
+    assert cli_service._gateway_base() == "http://gateway.local:4444"
+    cli_service._gateway_base.cache_clear()
+    assert cli_service._gateway_base() == "http://gateway.local:5555"
+
+
+class TestMakeAuthenticatedRequest:
+    """Test the request helper."""
+
+    async def test_json_body_is_sent_as_bytes(self, monkeypatch):
+        """JSON payloads are pre-encoded and sent as the raw request body."""
+        monkeypatch.setenv("MCPGATEWAY_BEARER_TOKEN", "abc123")
+        response = MagicMock(status=200)
+        response.json = AsyncMock(return_value={"ok": True})
+        session = MagicMock()
+        session.request.return_value.__aenter__ = AsyncMock(return_value=response)
+        session.request.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(cli_service, "_get_session", return_value=session):
+            result = await cli_service.make_authenticated_request("POST", "/import", json_data={"name": "café", 1: "x"})
+
+        assert result == {"ok": True}
+        kwargs = session.request.call_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["data"]) == {"name": "café", "1": "x"}
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    async def test_timeout_raises_cli_error(self, monkeypatch):
+        """A timed-out request is reported as a CLIError rather than a traceback."""
+        monkeypatch.setenv("MCPGATEWAY_BEARER_TOKEN", "abc123")
+        session = MagicMock()
+        session.request.return_value.__aenter__ = AsyncMock(side_effect=asyncio.TimeoutError())
+        session.request.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with patch.object(cli_service, "_get_session", return_value=session):
+            with pytest.raises(cli_service.CLIError, match="timed out"):
+                await cli_service.make_authenticated_request("GET", "/export")
+
+
+class TestGetAuthToken:
+    """Test auth token resolution and caching."""
+
+    async def test_bearer_token_from_env(self, monkeypatch):
+        """The bearer token env var wins over basic auth."""
+        monkeypatch.setenv("MCPGATEWAY_BEARER_TOKEN", "env-token")
+        assert await cli_service.get_auth_token() == "env-token"
+
+    async def test_env_token_snapshot(self, monkeypatch):
+        """The token read at import wins until refreshed."""
+        monkeypatch.setenv("MCPGATEWAY_BEARER_TOKEN", "startup-token")
+        cli_service.refresh_env_token()
+        monkeypatch.setenv("MCPGATEWAY_BEARER_TOKEN", "changed-token")
+        assert await cli_service.get_auth_token() == "startup-token"
+
+        cli_service.refresh_env_token()
+        assert await cli_service.get_auth_token() == "changed-token"
+
+    async def test_basic_auth_is_cached(self, monkeypatch):
+        """Basic credentials are encoded once and reused while unchanged."""
+        monkeypatch.delenv("MCPGATEWAY_BEARER_TOKEN", raising=False)
+        monkeypatch.setattr(cli_service.settings, "basic_auth_user", "test")
+        monkeypatch.setattr(cli_service.settings, "basic_auth_password", "password")
+
+        with patch.object(cli_service.base64, "b64encode", wraps=cli_service.base64.b64encode) as mock_encode:
+            assert await cli_service.get_auth_token() == "Basic dGVzdDpwYXNzd29yZA=="
+            assert await cli_service.get_auth_token() == "Basic dGVzdDpwYXNzd29yZA=="
+        assert mock_encode.call_count == 1
+
+    async def test_cache_follows_credential_changes(self, monkeypatch):
+        """Changing the env token or credentials invalidates the cached value."""
+        monkeypatch.delenv("MCPGATEWAY_BEARER_TOKEN", raising=False)
+        monkeypatch.setattr(cli_service.settings, "basic_auth_user", "")
+        assert await cli_service.get_auth_token() is None
+
+        monkeypatch.setenv("MCPGATEWAY_BEARER_TOKEN", "new-token")
+        assert await cli_service.get_auth_token() == "new-token"
+
+
+class TestAuthHeaders:
+    """Test the cached Authorization headers."""
+
+    def test_bearer_token(self):
+        """Plain tokens are sent as Bearer credentials."""
+        headers = cli_service._auth_headers("abc123")
+        assert headers["Authorization"] == "Bearer abc123"
+        assert headers["Content-Type"] == "application/json"
+        assert cli_service._auth_headers("abc123") is headers
+
+    def test_basic_token(self):
+        """Basic credentials are passed through unchanged."""
+        headers = cli_service._auth_headers("Basic dGVzdDpwYXNzd29yZA==")
+        assert headers["Authorization"] == "Basic dGVzdDpwYXNzd29yZA=="
+
+    def test_headers_are_read_only(self):
+        """The shared mapping can't be modified by callers."""
+        headers = cli_service._auth_headers("abc123")
+        with pytest.raises(TypeError):
+            headers["Authorization"] = "Bearer other"
+
+
+class TestExportConfiguration:
+    """Test the export command business logic."""
+
+    async def test_export_writes_pretty_utf8_json(self, tmp_path):
+        """The export is written as indented UTF-8 JSON without ASCII escaping."""
+        export_data = {
+            "version": "2025-03-26",
+            "entities": {"tools": [{"name": "café"}]},
+            "metadata": {"entity_counts": {"tools": 1}},
+        }
+        output_file = tmp_path / "nested" / "export.json"
+
+        with patch.object(cli_service, "_download_export", new_callable=AsyncMock, return_value=export_data):
+            await cli_service.export_configuration(output_file=str(output_file))
+
+        content = output_file.read_text(encoding="utf-8")
+        assert "café" in content
+        assert '\n  "version"' in content
+        assert json.loads(content) == export_data
+
+    async def test_export_summary(self, tmp_path, capsys):
+        """Non-zero entity counts are listed in order after the total."""
+        export_data = {"version": "2025-03-26", "metadata": {"entity_counts": {"tools": 5, "gateways": 0, "servers": 3}}}
+
+        with patch.object(cli_service, "_download_export", new_callable=AsyncMock, return_value=export_data):
+            await cli_service.export_configuration(output_file=str(tmp_path / "export.json"))
+
+        out = capsys.readouterr().out
+        assert "📊 Exported 8 total entities:\n   • tools: 5\n   • servers: 3\n" in out
+        assert "gateways" not in out
+
+    async def test_export_default_filename(self, tmp_path, monkeypatch):
+        """Without an output file the export is named after the local time."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(cli_service.time, "strftime", lambda fmt: "20250102-030405")
+
+        with patch.object(cli_service, "_download_export", new_callable=AsyncMock, return_value={"version": "2025-03-26"}):
+            await cli_service.export_configuration()
+
+        assert json.loads((tmp_path / "mcpgateway-export-20250102-030405.json").read_text(encoding="utf-8")) == {"version": "2025-03-26"}
+
+    async def test_export_query_params(self, tmp_path):
+        """Only the filters that are set are sent as query parameters."""
+        with patch.object(cli_service, "_download_export", new_callable=AsyncMock, return_value={}) as mock_download:
+            await cli_service.export_configuration(output_file=str(tmp_path / "a.json"))
+            await cli_service.export_configuration(output_file=str(tmp_path / "b.json"), types="tools,servers", tags="prod", include_inactive=True, include_dependencies=False)
+
+        assert mock_download.call_args_list[0].args[0] == {}
+        assert mock_download.call_args_list[1].args[0] == {"types": "tools,servers", "tags": "prod", "include_inactive": "true", "include_dependencies": "false"}
+
+    @staticmethod
+    def _fake_response(body, content_length):
+        """Build a stand-in for an aiohttp response serving *body*."""
+
+        async def iter_chunked(size):
+            for start in range(0, len(body), size):
+                yield body[start : start + size]
+
+        response = MagicMock(content_length=content_length)
+        response.content.iter_chunked = iter_chunked
+        response.json = AsyncMock(return_value=json.loads(body))
+        return response
+
+    async def test_large_export_is_streamed_to_disk(self, tmp_path, capsys):
+        """Large bodies are written as received and summarized from the file."""
+        export_data = {
+            "version": "2025-03-26",
+            "exported_at": "2025-01-01T00:00:00Z",
+            "entities": {"tools": [{"name": f"tool-{i}"} for i in range(3)]},
+            "metadata": {"entity_counts": {"tools": 3, "gateways": 0}},
+        }
+        body = json.dumps(export_data).encode()
+        response = self._fake_response(body, content_length=None)
+        output_file = tmp_path / "export.json"
+
+        @asynccontextmanager
+        async def fake_authenticated_response(*args, **kwargs):
+            yield response
+
+        with patch.object(cli_service, "_authenticated_response", fake_authenticated_response), patch.object(cli_service, "_STREAM_CHUNK_SIZE", 16):
+            await cli_service.export_configuration(output_file=str(output_file), verbose=True)
+
+        assert output_file.read_bytes() == body
+        response.json.assert_not_called()
+        out = capsys.readouterr().out
+        assert "Exported 3 total entities:\n   • tools: 3\n" in out
+        assert "gateways" not in out
+        assert "Version: 2025-03-26" in out
+
+    async def test_failed_stream_keeps_existing_export(self, tmp_path):
+        """A download that fails part-way leaves neither a partial file nor a damaged backup."""
+        output_file = tmp_path / "export.json"
+        output_file.write_text('{"previous": true}', encoding="utf-8")
+
+        async def broken_iter_chunked(size):
+            yield b'{"version": "2025'
+            raise cli_service.aiohttp.ClientPayloadError("connection lost")
+
+        response = MagicMock(content_length=None)
+        response.content.iter_chunked = broken_iter_chunked
+
+        @asynccontextmanager
+        async def fake_authenticated_response(*args, **kwargs):
+            yield response
+
+        with patch.object(cli_service, "_authenticated_response", fake_authenticated_response):
+            with pytest.raises(cli_service.aiohttp.ClientPayloadError):
+                await cli_service._download_export({}, output_file)
+
+        assert output_file.read_text(encoding="utf-8") == '{"previous": true}'
+        assert [p.name for p in tmp_path.iterdir()] == ["export.json"]
+
+    async def test_small_export_is_decoded(self, tmp_path):
+        """Bodies under the threshold are decoded instead of streamed."""
+        body = b'{"version": "2025-03-26"}'
+        response = self._fake_response(body, content_length=len(body))
+
+        @asynccontextmanager
+        async def fake_authenticated_response(*args, **kwargs):
+            yield response
+
+        with patch.object(cli_service, "_authenticated_response", fake_authenticated_response):
+            result = await cli_service._download_export({}, tmp_path / "export.json")
+
+        assert result == {"version": "2025-03-26"}
+        assert not (tmp_path / "export.json").exists()
+
+
+class TestImportConfiguration:
+    """Test the import command business logic."""
+
+    async def test_import_reads_file_and_posts_payload(self, tmp_path):
+        """The input file is parsed and posted as import_data."""
+        import_data = {"version": "2025-03-26", "entities": {"tools": [{"name": "café"}]}}
+        input_file = tmp_path / "export.json"
+        input_file.write_text(json.dumps(import_data, ensure_ascii=False), encoding="utf-8")
+        result = {"status": "completed", "progress": {"total": 1, "processed": 1, "created": 1}}
+
+        with patch.object(cli_service, "make_authenticated_request", new_callable=AsyncMock, return_value=result) as mock_request:
+            await cli_service.import_configuration(str(input_file), conflict_strategy="skip", dry_run=True)
+
+        request_data = mock_request.call_args.kwargs["json_data"]
+        assert request_data["import_data"] == import_data
+        assert request_data["conflict_strategy"] == "skip"
+        assert request_data["dry_run"] is True
+
+    async def test_import_reports_progress(self, tmp_path, capsys):
+        """Every progress counter is reported, defaulting to zero."""
+        input_file = tmp_path / "export.json"
+        input_file.write_text('{"version": "2025-03-26", "entities": {}}', encoding="utf-8")
+        result = {"status": "completed", "progress": {"total": 3, "processed": 3, "created": 2, "skipped": 1}}
+
+        with patch.object(cli_service, "make_authenticated_request", new_callable=AsyncMock, return_value=result):
+            await cli_service.import_configuration(str(input_file))
+
+        out = capsys.readouterr().out
+        assert "✅ Import completed!\n📊 Results:\n" in out
+        assert "   • Total entities: 3\n   • Processed: 3\n   • Created: 2\n   • Updated: 0\n   • Skipped: 1\n   • Failed: 0\n" in out
+
+    async def test_import_include_selection(self, tmp_path):
+        """The --include string is parsed into per-type name lists."""
+        input_file = tmp_path / "export.json"
+        input_file.write_text('{"version": "2025-03-26", "entities": {}}', encoding="utf-8")
+
+        with patch.object(cli_service, "make_authenticated_request", new_callable=AsyncMock, return_value={"status": "completed"}) as mock_request:
+            await cli_service.import_configuration(str(input_file), include="tools: weather_api, translate ,;servers:ai-server;bogus; prompts:")
+
+        assert mock_request.call_args.kwargs["json_data"]["selected_entities"] == {
+            "tools": ["weather_api", "translate"],
+            "servers": ["ai-server"],
+            "prompts": [],
+        }
+
+    async def test_import_missing_file(self, tmp_path):
+        """A missing input file raises CLIError."""
+        with pytest.raises(cli_service.CLIError, match="Input file not found"):
+            await cli_service.import_configuration(str(tmp_path / "missing.json"))
+
+
+class TestStreamingImport:
+    """Test the batched, incremental import path."""
+
+    @pytest.fixture
+    def export_file(self, tmp_path):
+        """Write an export whose entities are listed out of dependency order."""
+        export_data = {
+            "version": "2025-03-26",
+            "exported_at": "2025-01-01T00:00:00Z",
+            "entities": {
+                "tools": [{"name": f"tool-{i}", "timeout": 1.5} for i in range(5)],
+                "gateways": [{"name": "gw"}],
+            },
+            "metadata": {"entity_counts": {"tools": 5, "gateways": 1}},
+        }
+        input_file = tmp_path / "export.json"
+        input_file.write_text(json.dumps(export_data), encoding="utf-8")
+        return input_file
+
+    async def test_stream_posts_batches_in_dependency_order(self, export_file):
+        """Entities are posted per type, gateways before tools, in batches."""
+
+        def fake_response(method, url, json_data=None, params=None):
+            count = sum(len(v) for v in json_data["import_data"]["entities"].values())
+            return {"import_id": f"id-{count}", "status": "completed", "progress": {"total": count, "processed": count, "created": count}}
+
+        with patch.object(cli_service, "make_authenticated_request", new_callable=AsyncMock, side_effect=fake_response) as mock_request:
+            await cli_service.import_configuration(str(export_file), conflict_strategy="skip", stream=True, batch_size=2)
+
+        payloads = [call.kwargs["json_data"] for call in mock_request.call_args_list]
+        assert [list(p["import_data"]["entities"]) for p in payloads] == [["gateways"], ["tools"], ["tools"], ["tools"]]
+        assert [len(p["import_data"]["entities"]["tools"]) for p in payloads[1:]] == [2, 2, 1]
+        assert payloads[1]["import_data"]["entities"]["tools"][0] == {"name": "tool-0", "timeout": 1.5}
+        assert all(p["import_data"]["version"] == "2025-03-26" and p["import_data"]["exported_at"] == "2025-01-01T00:00:00Z" for p in payloads)
+        assert all(p["conflict_strategy"] == "skip" for p in payloads)
+
+    async def test_stream_merges_results(self, export_file):
+        """Progress counters, warnings and errors are combined across batches."""
+        responses = [
+            {"status": "completed", "progress": {"total": 1, "processed": 1, "created": 1}, "warnings": ["w1"]},
+            {"status": "completed", "progress": {"total": 5, "processed": 5, "failed": 2}, "errors": ["e1"]},
+        ]
+
+        with patch.object(cli_service, "make_authenticated_request", new_callable=AsyncMock, side_effect=responses):
+            with pytest.raises(cli_service.CLIError, match="Import finished with errors"):
+                await cli_service.import_configuration(str(export_file), stream=True)
+
+        merged = cli_service._merge_import_results(responses)
+        assert merged["progress"] == {"total": 6, "processed": 6, "created": 1, "updated": 0, "skipped": 0, "failed": 2}
+        assert merged["warnings"] == ["w1"]
+        assert merged["errors"] == ["e1"]
+
+    async def test_stream_limits_batches_in_flight(self, export_file):
+        """No more than `concurrency` batches are read or sent at once."""
+        in_flight = peak = parsed = finished = read_ahead = 0
+        iter_entity_batches = cli_service._iter_entity_batches
+
+        def counting_batches(*args):
+            nonlocal parsed, read_ahead
+            for batch in iter_entity_batches(*args):
+                parsed += 1
+                read_ahead = max(read_ahead, parsed - finished)
+                yield batch
+
+        async def slow_response(method, url, json_data=None, params=None):
+            nonlocal in_flight, peak, finished
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            finished += 1
+            return {"status": "completed", "progress": {"total": 1}}
+
+        with patch.object(cli_service, "_iter_entity_batches", counting_batches):
+            with patch.object(cli_service, "make_authenticated_request", side_effect=slow_response) as mock_request:
+                await cli_service.import_configuration(str(export_file), stream=True, batch_size=1, concurrency=2)
+
+        assert mock_request.call_count == 6
+        assert peak == 2
+        assert read_ahead == 2
+
+    async def test_stream_stops_after_failed_batch(self, export_file):
+        """Once a batch fails no further batches are read or sent."""
+        calls = []
+
+        async def failing_response(method, url, json_data=None, params=None):
+            entities = json_data["import_data"]["entities"]
+            calls.append(entities)
+            if entities.get("tools") == [{"name": "tool-0", "timeout": 1.5}]:
+                raise cli_service.CLIError("API request failed (500): boom")
+            await asyncio.sleep(0.01)
+            return {"status": "completed"}
+
+        with patch.object(cli_service, "make_authenticated_request", side_effect=failing_response):
+            with pytest.raises(cli_service.CLIError, match="boom"):
+                await cli_service.import_configuration(str(export_file), stream=True, batch_size=1, concurrency=2)
+
+        # gateways, then the failing tools batch and the one already in flight beside it
+        assert len(calls) == 3
+
+    async def test_stream_skips_types_without_entities(self, export_file):
+        """Only entity types with a non-zero count in the metadata are scanned."""
+        with patch.object(cli_service, "_iter_entity_batches", wraps=cli_service._iter_entity_batches) as mock_batches:
+            with patch.object(cli_service, "make_authenticated_request", new_callable=AsyncMock, return_value={"status": "completed"}):
+                await cli_service.import_configuration(str(export_file), stream=True)
+
+        assert [c.args[1] for c in mock_batches.call_args_list] == ["gateways", "tools"]
+
+    async def test_stream_without_counts_scans_every_type(self, tmp_path):
+        """Files without entity counts fall back to scanning every entity type."""
+        input_file = tmp_path / "export.json"
+        input_file.write_text(json.dumps({"version": "2025-03-26", "exported_at": "now", "entities": {"prompts": [{"name": "p"}]}}), encoding="utf-8")
+
+        with patch.object(cli_service, "make_authenticated_request", new_callable=AsyncMock, return_value={"status": "completed"}) as mock_request:
+            await cli_service.import_configuration(str(input_file), stream=True)
+
+        assert mock_request.call_args.kwargs["json_data"]["import_data"]["entities"] == {"prompts": [{"name": "p"}]}
+
+    async def test_stream_requires_ijson(self, export_file):
+        """A clear error is raised when ijson isn't installed."""
+        with patch.object(cli_service, "IJSON_AVAILABLE", False):
+            with pytest.raises(cli_service.CLIError, match="requires ijson"):
+                await cli_service.import_configuration(str(export_file), stream=True)
@@ -33,7 +33,7 @@ async def test_get_auth_token_from_env():
 async def test_get_auth_token_basic_fallback():
     """Test fallback to basic auth."""
     with patch.dict("os.environ", {}, clear=True):
-        with patch("mcpgateway.cli_export_import.settings") as mock_settings:
+        with patch("mcpgateway.services.cli_service.settings") as mock_settings:
             mock_settings.basic_auth_user = "admin"
             mock_settings.basic_auth_password = "secret"
 
@@ -45,7 +45,7 @@ async def test_get_auth_token_basic_fallback():
 async def test_get_auth_token_no_config():
     """Test when no auth is configured."""
     with patch.dict("os.environ", {}, clear=True):
-        with patch("mcpgateway.cli_export_import.settings") as mock_settings:
+        with patch("mcpgateway.services.cli_service.settings") as mock_settings:
             mock_settings.basic_auth_user = None
             mock_settings.basic_auth_password = None
 
@@ -218,7 +218,7 @@ async def test_make_authenticated_request_no_auth():
     # First-Party
     from mcpgateway.cli_export_import import make_authenticated_request
 
-    with patch("mcpgateway.cli_export_import.get_auth_token", return_value=None):
+    with patch("mcpgateway.services.cli_service.get_auth_token", return_value=None):
         with pytest.raises(AuthenticationError, match="No authentication configured"):
             await make_authenticated_request("GET", "/test")
 
@@ -230,8 +230,8 @@ def test_make_authenticated_request_auth_logic():
     from mcpgateway.cli_export_import import make_authenticated_request
 
     # Test that the function creates the right headers for basic auth
-    with patch("mcpgateway.cli_export_import.get_auth_token") as mock_get_token:
-        with patch("mcpgateway.cli_export_import.settings") as mock_settings:
+    with patch("mcpgateway.services.cli_service.get_auth_token") as mock_get_token:
+        with patch("mcpgateway.services.cli_service.settings") as mock_settings:
             mock_settings.host = "localhost"
             mock_settings.port = 8000
 
@@ -279,8 +279,8 @@ def test_make_authenticated_request_bearer_auth_logic():
     from mcpgateway.cli_export_import import make_authenticated_request
 
     # Test that the function creates the right headers for bearer auth
-    with patch("mcpgateway.cli_export_import.get_auth_token") as mock_get_token:
-        with patch("mcpgateway.cli_export_import.settings") as mock_settings:
+    with patch("mcpgateway.services.cli_service.get_auth_token") as mock_get_token:
+        with patch("mcpgateway.services.cli_service.settings") as mock_settings:
             mock_settings.host = "localhost"
             mock_settings.port = 8000
 
@@ -351,7 +351,7 @@ async def test_export_command_success():
     args.verbose = True
 
     with patch("mcpgateway.cli_export_import.make_authenticated_request", return_value=export_data):
-        with patch("mcpgateway.cli_export_import.settings") as mock_settings:
+        with patch("mcpgateway.services.cli_service.settings") as mock_settings:
             mock_settings.host = "localhost"
             mock_settings.port = 8000
 
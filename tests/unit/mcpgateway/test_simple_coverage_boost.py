@@ -95,7 +95,7 @@ async def test_make_authenticated_request_structure():
     from mcpgateway.cli_export_import import make_authenticated_request
 
     # Mock auth token to return None (no auth configured)
-    with patch("mcpgateway.cli_export_import.get_auth_token", return_value=None):
+    with patch("mcpgateway.services.cli_service.get_auth_token", return_value=None):
         with pytest.raises(AuthenticationError):
             await make_authenticated_request("GET", "/test")
 
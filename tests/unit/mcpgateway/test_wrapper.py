@@ -14,6 +14,7 @@ pydantic models are required and exercises almost every branch inside
 import asyncio
 import contextlib
 import errno
+import json
 import sys
 import types
 
@@ -81,6 +82,24 @@ def test_send_to_stdout_json_and_str(monkeypatch):
     assert any("plain text" in s for s in captured)
 
 
+def test_send_to_stdout_preserves_wide_ints_and_surrogates(monkeypatch):
+    captured = []
+    monkeypatch.setattr(sys.stdout, "write", captured.append)
+    monkeypatch.setattr(sys.stdout, "flush", lambda: None)
+
+    msg = {"jsonrpc": "2.0", "id": 1180591620717411303424, "result": {"text": "\ud800"}}
+    wrapper.send_to_stdout(msg)
+    assert json.loads(captured[0]) == msg
+
+
+def test_loads_json_preserves_wide_ints_and_surrogates():
+    assert wrapper.loads_json('{"id": -9223372036854775809}') == {"id": -9223372036854775809}
+    assert wrapper.loads_json(b'{"id": 1180591620717411303424}') == {"id": 1180591620717411303424}
+    assert wrapper.loads_json('"\\ud800"') == "\ud800"
+    with pytest.raises(ValueError):
+        wrapper.loads_json("{not json")
+
+
 def test_send_to_stdout_oserror(monkeypatch):
     wrapper._shutdown.clear()
 
@@ -130,6 +149,22 @@ async def test_sse_events_basic_and_tail():
     assert "tailonly" in events
 
 
+@pytest.mark.asyncio
+async def test_sse_events_split_across_chunks():
+    wrapper._shutdown.clear()
+
+    async def fake_iter_bytes():
+        # events split mid-line, CRLF endings, comments and multi-line data
+        yield b"data: par"
+        yield b"tial\r\n\r\n: keep-alive\n\ndata: one\ndata: two\n"
+        yield b"\ndata: caf\xc3"
+        yield b"\xa9\n\n"
+
+    resp = types.SimpleNamespace(aiter_bytes=fake_iter_bytes)
+    events = [e async for e in wrapper.sse_events(resp)]
+    assert events == ["partial", "one\ntwo", "café"]
+
+
 # -------------------
 # Settings dataclass
 # -------------------
@@ -264,6 +299,23 @@ async def test_forward_once_json_and_invalid(monkeypatch):
     assert any(isinstance(o, dict) and "error" in o for o in captured)
 
 
+@pytest.mark.asyncio
+async def test_forward_once_encodes_json_body(monkeypatch):
+    wrapper._shutdown.clear()
+    monkeypatch.setattr(wrapper, "send_to_stdout", lambda obj: None)
+    sent = {}
+
+    class RecordingClient(DummyClient):
+        def stream(self, *a, **k):
+            sent.update(k)
+            return self._resp
+
+    client = RecordingClient(DummyResp(200, "application/json", b'{"ok":1}'))
+    await wrapper.forward_once(client, wrapper.Settings("x", None), {"params": {"name": "café"}})
+    assert sent["data"] == '{"params":{"name":"café"}}'.encode("utf-8")
+    assert sent["headers"]["Content-Type"] == "application/json; charset=utf-8"
+
+
 @pytest.mark.asyncio
 async def test_forward_once_ndjson_and_sse_and_http_error(monkeypatch):
     wrapper._shutdown.clear()